@@ -1,9 +1,7 @@
 
 from typing import List, Optional
 import os
-import subprocess
 from pathlib import Path
-import tempfile
 
 from PIL import Image
 
@@ -12,6 +10,11 @@ from .BoundingBox import BoundingBox
 from .Image import RectangularBitmap
 from .Sound import Sound
 
+# Animations larger than these dimensions (in pixels) are assumed to have
+# bogus coordinates, so their frames will not be reframed.
+MAXIMUM_ANIMATION_WIDTH = 5000
+MAXIMUM_ANIMATION_HEIGHT = 5000
+
 ## Defines an an animation as a series of rectangular bitmaps (frames)
 ## that display at a given framerate and are optionally 
 ## accompanied by audio.
@@ -167,28 +170,50 @@ class Animation(Asset):
         if no_frames_present:
             return
 
-        # GET ALL THE BOUNDING BOXES IN THE ANIMATION.
-        frame_bounding_boxes: List[BoundingBox] = []
-        for frame in self.frames:
-            bounding_box: bool = frame._bounding_box
-            if bounding_box is not None:
-                frame_bounding_boxes.append(bounding_box)
-        if len(frame_bounding_boxes) == 0:
-            return None
-
         # FIND THE SMALLEST RECTANGLE THAT CONTAINS ALL THE FRAME BOUNDING BOXES.
         # This smallest rectangle will have the following vertices:
         #  - Left: The left vertex of the leftmost bounding box.
         #  - Top: The top vertex of the topmost bounding box.
         #  - Right: The right vertex of the rightmost bounding box.
         #  - Bottom: The bottom vertext of the bottommost bounding box.
-        minimal_left: int = min([bounding_box.left for bounding_box in frame_bounding_boxes])
-        minimal_top: int = min([bounding_box.top for bounding_box in frame_bounding_boxes])
-        minimal_right: int = max([bounding_box.right for bounding_box in frame_bounding_boxes])
-        minimal_bottom: int = max([bounding_box.bottom for bounding_box in frame_bounding_boxes])
+        # All four vertices are found in a single pass over the frames.
+        frame_bounding_box_found: bool = False
+        for frame in self.frames:
+            bounding_box: BoundingBox = frame._bounding_box
+            if bounding_box is None:
+                continue
+
+            if not frame_bounding_box_found:
+                # START WITH THE FIRST BOUNDING BOX.
+                minimal_left: int = bounding_box.left
+                minimal_top: int = bounding_box.top
+                minimal_right: int = bounding_box.right
+                minimal_bottom: int = bounding_box.bottom
+                frame_bounding_box_found = True
+                continue
+
+            # EXPAND THE RECTANGLE TO CONTAIN THIS BOUNDING BOX.
+            if bounding_box.left < minimal_left:
+                minimal_left = bounding_box.left
+            if bounding_box.top < minimal_top:
+                minimal_top = bounding_box.top
+            if bounding_box.right > minimal_right:
+                minimal_right = bounding_box.right
+            if bounding_box.bottom > minimal_bottom:
+                minimal_bottom = bounding_box.bottom
+        if not frame_bounding_box_found:
+            return None
         self.__minimal_bounding_box = BoundingBox(minimal_top, minimal_left, minimal_bottom, minimal_right)
         return self.__minimal_bounding_box
 
+    ## Discards the cached minimal bounding box so it will be recalculated from
+    ## the frames the next time it is needed. Because calculating the minimal
+    ## bounding box requires visiting every frame, it is only calculated once.
+    ## Client code that adds, removes, or moves frames after the minimal
+    ## bounding box has been calculated must call this method.
+    def _invalidate_minimal_bounding_box(self):
+        self.__minimal_bounding_box = None
+
     ## \return True if this animation has at least one audio chunk; False otherwise.
     @property
     def __has_audio(self) -> bool:
@@ -224,7 +249,12 @@ class Animation(Asset):
     ##            concatenation of the entries in self.audios.
     ## \param[in] command_line_arguments - All the command-line arguments provided to the 
     ##            script that invoked this function.
-    def export(self, root_directory_path: str, command_line_arguments):
+    ## \param[in] frame_export_worker_count - The most frames to export at once. By default,
+    ##            frames are exported one at a time, in order, on the calling thread. 
+    ##            Frames can decompress their pixels when exported, so only allow more
+    ##            than one worker if the frames' pixels can be safely decompressed at the
+    ##            same time and in any order.
+    def export(self, root_directory_path: str, command_line_arguments, frame_export_worker_count: int = 1):
         # DETERMINE WHERE EXPORTED FRAMES/AUDIO SHOULD BE STORED.
         if self.__has_audio_only:
             # DO NOT CREATE A SUBDIRECTORY FOR THIS ANIMATION.
@@ -247,9 +277,11 @@ class Animation(Asset):
         #    ...
         #  Up to the number of bitmaps in this animation.
         self._reframe_to_animation_size(command_line_arguments)
-        for index, frame in enumerate(self.frames):
-            export_filepath = os.path.join(frame_export_directory_path, f'{index}')
-            frame.export(export_filepath, command_line_arguments)
+        # Joining a trailing empty component gives the directory path with its separator,
+        # so each frame's filepath can be built by simple concatenation.
+        frame_export_filepath_prefix = os.path.join(frame_export_directory_path, '')
+        frame_exports = ((frame, f'{frame_export_filepath_prefix}{index}') for index, frame in enumerate(self.frames))
+        self._export_all(frame_exports, command_line_arguments, frame_export_worker_count)
 
         # EXPORT INDIVIDUAL SOUNDS ACCORDING TO THEIR SETTINGS.
         # The export directory will contain files like the following:
@@ -282,31 +314,70 @@ class Animation(Asset):
             # understand them.
             return
 
+        # GET THE DIMENSIONS OF THE ANIMATION.
+        # These are the same for every frame, so they are only calculated once.
         bounding_box = self._minimal_bounding_box
+        if bounding_box is None:
+            # There are no frames to reframe.
+            self.__animation_framing_applied = True
+            return
+        animation_left: int = bounding_box.left
+        animation_top: int = bounding_box.top
+        full_frame_dimensions = (bounding_box.width, bounding_box.height)
+        animation_exceeds_max_width = bounding_box.width > MAXIMUM_ANIMATION_WIDTH
+        animation_exceeds_max_height = bounding_box.height > MAXIMUM_ANIMATION_HEIGHT
+        if animation_exceeds_max_width or animation_exceeds_max_height:
+            # CREATE THE FRAME IMAGES WITHOUT REFRAMING THEM.
+            # Client code might apply keyframes to the frame images after framing,
+            # so the images must still exist even though they are not reframed.
+            for frame in self.frames:
+                if frame._exportable_image is None:
+                    frame.create_exportable_image_from_pixels()
+            self.__animation_framing_applied = True
+            return
+
+        blank_full_frame: Optional[Image.Image] = None
+        blank_full_frame_palette = None
         for frame in self.frames:
             bitmap: Image = frame._exportable_image
+            bitmap_created_from_pixels: bool = False
             if bitmap is None:
                 frame.create_exportable_image_from_pixels()
                 bitmap = frame._exportable_image
                 if bitmap is None:
                     continue
+                bitmap_created_from_pixels = True
+
+            # SKIP FRAMES THAT ALREADY FILL THE ANIMATION.
+            # Many animations have frames that already span the full animation. Pasting
+            # such a frame onto a full-sized frame would just reproduce the same image,
+            # so the frame's own image is kept instead. This is only done when the image
+            # was just created from the frame's pixels, as it then has the frame's palette
+            # and no other image information, just like a full-sized frame would. An 
+            # image provided by client code might carry other image information or be
+            # shared with other frames, so it is always pasted onto a new full-sized frame.
+            bitmap_left_top_with_respect_to_animation = (frame.left - animation_left, frame.top - animation_top)
+            bitmap_fills_animation = bitmap_created_from_pixels and \
+                (bitmap_left_top_with_respect_to_animation == (0, 0)) and \
+                (bitmap.size == full_frame_dimensions) and \
+                (bitmap.mode == 'P')
+            if bitmap_fills_animation:
+                continue
 
             # CREATE THE FULL-SIZED FRAME TO HOLD THE ANIMATION IMAGE.
             # The full frame must be filled with the alpha color used throughout the game.
-            MAXIMUM_ANIMATION_WIDTH = 5000
-            MAXIMUM_ANIMATION_HEIGHT = 5000
-            frame_exceeds_max_width = bounding_box.width > MAXIMUM_ANIMATION_WIDTH
-            frame_exceeds_max_height = bounding_box.height > MAXIMUM_ANIMATION_HEIGHT
-            if frame_exceeds_max_width or frame_exceeds_max_height:
-                continue
-            full_frame_dimensions = (bounding_box.width, bounding_box.height)
-            full_frame = Image.new('P', full_frame_dimensions, color = self._alpha_color)
-            if frame._palette is not None:
-                # full_frame.palette = bitmap.palette
-                full_frame.putpalette(frame._palette.raw_rgb_bytes())
+            # Frames in an animation almost always share the same palette, so a blank
+            # full frame (with the palette installed) is only created when the palette
+            # changes. Each frame then starts from its own copy of this blank frame.
+            palette_changed = (blank_full_frame is None) or (frame._palette is not blank_full_frame_palette)
+            if palette_changed:
+                blank_full_frame = Image.new('P', full_frame_dimensions, color = self._alpha_color)
+                if frame._palette is not None:
+                    blank_full_frame.putpalette(frame._palette.raw_rgb_bytes())
+                blank_full_frame_palette = frame._palette
+            full_frame = blank_full_frame.copy()
 
             # PASTE THE ANIMATION FRAME IN THE APPROPRIATE PLACE.
-            bitmap_left_top_with_respect_to_animation = (frame.left - bounding_box.left, frame.top - bounding_box.top)
             full_frame.paste(bitmap, box = bitmap_left_top_with_respect_to_animation)
             frame._exportable_image = full_frame
         # Applying the framing or checking if it has been applied is pretty costly,
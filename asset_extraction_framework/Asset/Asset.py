@@ -7,4 +7,42 @@ class Asset:
         # DO NOTHING.
         # Because there is no actual data stored in this base class,
         # there is nothing to do.
-        pass
\ No newline at end of file
+        pass
+
+    ## Writes the given bytes to a file, replacing any existing file.
+    ## \param[in] filepath - The filepath of the file to write.
+    ## \param[in] data - The bytes to write.
+    @staticmethod
+    def _write_bytes(filepath: str, data: bytes):
+        # WRITE THE BYTES.
+        # A single write larger than the file's buffer is passed straight to the
+        # operating system, so even large data is not copied through the buffer.
+        with open(filepath, 'wb') as file:
+            file.write(data)
+
+    ## Exports each of the given assets, in parallel if requested.
+    ## \param[in] asset_exports - For each asset to export, a tuple of the asset and
+    ##            the path to pass to its export method.
+    ## \param[in] command_line_arguments - All the command-line arguments provided to the 
+    ##            script that invoked this function.
+    ## \param[in] worker_count - The most assets to export at once. When this is one,
+    ##            the assets are exported one at a time, in order, on the calling thread.
+    @staticmethod
+    def _export_all(asset_exports, command_line_arguments, worker_count: int = 1):
+        # EXPORT THE ASSETS IN ORDER.
+        if worker_count <= 1:
+            for asset, export_path in asset_exports:
+                asset.export(export_path, command_line_arguments)
+            return
+
+        # EXPORT THE ASSETS IN PARALLEL.
+        # Importing the thread pool also imports the threading machinery, so it is
+        # only imported when the assets are actually exported in parallel.
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers = worker_count) as executor:
+            pending_exports = [executor.submit(asset.export, export_path, command_line_arguments)
+                for asset, export_path in asset_exports]
+            # Getting the result of each export re-raises any exception that occurred
+            # while exporting that asset.
+            for pending_export in pending_exports:
+                pending_export.result()
@@ -2,6 +2,10 @@
 
 # Defines a general-purpose bounding box.
 class BoundingBox:
+    # A bounding box is created for every frame of every animation, so slots
+    # are used to keep these objects small and their attribute access fast.
+    __slots__ = ('top', 'left', 'bottom', 'right')
+
     def __init__(self, top = None, left = None, bottom = None, right = None):
         self.top = top
         self.left = left
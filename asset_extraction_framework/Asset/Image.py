@@ -1,6 +1,5 @@
 
 import os
-from math import ceil
 from typing import Optional
 
 from PIL import Image
@@ -137,7 +136,9 @@ class RectangularBitmap(Asset):
     ## (pixels) should occupy, rounded up to the closest whole byte.
     @property
     def __expected_bitmap_length_in_bytes(self) -> int:
-        return int(float(self.width * self.height * self._bits_per_pixel) / float(8.))
+        # Adding seven bits before dividing by eight rounds up to the closest whole byte
+        # while staying in integer arithmetic.
+        return (self.width * self.height * self._bits_per_pixel + 7) >> 3
 
     ## Returns True if this object contains enough information to
     ## export a bitmap image, false otherwise.
@@ -149,12 +150,6 @@ class RectangularBitmap(Asset):
             (self._bits_per_pixel is not None) and \
             (not self.__is_empty)
 
-    ## \return True when the uncompressed image pixels have the same length
-    ## as the expected length; False otherwise.
-    @property
-    def __has_expected_length(self) -> bool:
-        return len(self.pixels) == self.__expected_bitmap_length_in_bytes
-
     ## \return True when the image has no width or height; False otherwise.
     @property
     def __is_empty(self) -> bool:
@@ -176,9 +171,24 @@ class RectangularBitmap(Asset):
     def create_exportable_image_from_pixels(self, image_mode: str = 'P'):
         # CREATE AN IMAGE ONLY IF THERE IS ENOUGH DATA PRESENT.
         if self.__is_valid:
-            if not self.__has_expected_length:
-                assert_equal(len(self.pixels), self.__expected_bitmap_length_in_bytes, 'pixels length in bytes', warn_only = True)
-            self._exportable_image = Image.frombytes(image_mode, (self.width, self.height), self.pixels)
+            # VERIFY THE PIXELS HAVE THE EXPECTED LENGTH.
+            # Because client code might decompress the pixels whenever they are accessed,
+            # the pixels and their expected length are each only retrieved once.
+            pixels = self.pixels
+            expected_bitmap_length_in_bytes = self.__expected_bitmap_length_in_bytes
+            assert_equal(len(pixels), expected_bitmap_length_in_bytes, 'pixels length in bytes', warn_only = True)
+
+            # CREATE THE IMAGE.
+            # When the pixels are immutable bytes, Pillow can map them directly (for 8-bit modes)
+            # rather than copying them into a new buffer. Mutable pixels (like a bytearray or
+            # memoryview) must be copied, though. Otherwise, any later change to those pixels
+            # (like a reused decompression buffer or keyframe deltas applied in place) 
+            # would also change this image.
+            image_dimensions = (self.width, self.height)
+            if isinstance(pixels, bytes):
+                self._exportable_image = Image.frombuffer(image_mode, image_dimensions, pixels, 'raw', image_mode, 0, 1)
+            else:
+                self._exportable_image = Image.frombytes(image_mode, image_dimensions, pixels)
             if self._palette is not None:
                 self._exportable_image.putpalette(self._palette.raw_rgb_bytes())
         else:
@@ -216,13 +226,11 @@ class RectangularBitmap(Asset):
                 # other programs, record some vital information (the 
                 # dimensions) in the filename itself for later analysis.
                 raw_filename = f'{filename}.{self.width}.{self.height}'
-                with open(raw_filename, 'wb') as raw_file:
-                    raw_file.write(self._raw)
+                self._write_bytes(raw_filename, self._raw)
             # If the image is not compressed, self.raw will have no data.
             # In this case, we want to write self.pixels instead.
             elif self.__has_pixels:
-                with open(filename, 'wb') as pixels_file:
-                    pixels_file.write(self.pixels)
+                self._write_bytes(filename, self.pixels)
 
         else:
             # WRITE A VIEWABLE BITMAP FILE WITH PILLOW.
@@ -239,8 +247,7 @@ class RectangularBitmap(Asset):
                 # WRITE THE RAW PIXELS.
                 # This is a fallback in case there are pixels there but the bitmap cannot be created.
                 # TODO: Warn here.
-                with open(filename, 'wb') as pixels_file:
-                    pixels_file.write(self.pixels)
+                self._write_bytes(filename, self.pixels)
             else:
                 # CREATE AN EMPTY FILE.
                 # TODO: Warn here.
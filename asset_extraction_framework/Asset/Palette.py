@@ -1,5 +1,4 @@
 
-from io import BytesIO
 from functools import lru_cache
 
 from .Asset import Asset
@@ -20,9 +19,9 @@ class RgbPalette(Asset):
         self._blue_green_red_order = blue_green_red_order
 
         # READ THE PALETTE.
-        palette_entry_size_in_bytes = 4 if has_entry_alignment else 3
-        total_palette_bytes = palette_entry_size_in_bytes * total_palette_entries
-        self._raw_bytes = BytesIO(stream.read(total_palette_bytes))
+        self._palette_entry_size_in_bytes = 4 if has_entry_alignment else 3
+        total_palette_bytes = self._palette_entry_size_in_bytes * total_palette_entries
+        self._raw_bytes = stream.read(total_palette_bytes)
 
     ## Returns the definition of the palette in blue-green-red (BGR) order.
     ## \param[in] align_entries - Align each color tuple to the dword boundary 
@@ -33,75 +32,43 @@ class RgbPalette(Asset):
     ## Note that this will cause issues if the self._raw_bytes changes between runs, but that isn't expected.
     @lru_cache(maxsize = 2)
     def raw_bgr_bytes(self, align_entries: bool = True) -> bytearray:
-        self._raw_bytes.seek(0)
-        raw_bgr_bytes = bytearray()
-        for index in range(self._total_palette_entries):
-            # READ THIS COLOR TUPLE.
-            bgr_color_tuple = self._raw_bytes.read(3)
-            if self._has_entry_alignment:
-                self._raw_bytes.read(1)
-
-            # ENSURE THE COLOR INDEX IS IN BGR ORDER.
-            colors_in_rgb_order = not self._blue_green_red_order
-            if colors_in_rgb_order:
-                # PUT THE COLOR INDEX IN BGR ORDER.
-                # The colors are in RGB order, so the blue and the red must be swapped.
-                # 
-                # The slice notation below is used due to the following behavior:
-                #  - bytes[0] -> int (must be re-encoded to bytes, which is wasteful),
-                #  - bytes[0:1] -> bytes[0], but still as bytes.
-                red_color_index = bgr_color_tuple[0:1]
-                green_color_index = bgr_color_tuple[1:2]
-                blue_color_index = bgr_color_tuple[2:3]
-                bgr_color_tuple = blue_color_index + green_color_index + red_color_index
-
-            # ENSURE THE RIGHT PADDING IS ADDED.
-            if align_entries:
-                bgr_color_tuple += b'\x00'
-                assert len(bgr_color_tuple) == 4
-            else:
-                assert len(bgr_color_tuple) == 3
-
-            # STORE THIS COLOR TUPLE.
-            raw_bgr_bytes += bgr_color_tuple
-        return raw_bgr_bytes
+        # PUT THE COLORS IN BGR ORDER.
+        # When the colors are in RGB order, the blue and the red must be swapped.
+        blue_green_red_indices = (0, 1, 2) if self._blue_green_red_order else (2, 1, 0)
+        return self.__reorder_entries(blue_green_red_indices, align_entries)
 
     ## To prevent this rather expensive computation from occurring every time we retrieve
     ## the palette bytes, we will cache the result of this function call with the given args.
     ## Note that this will cause issues if the self._raw_bytes changes between runs, but that isn't expected.
     @lru_cache(maxsize = 2)
     def raw_rgb_bytes(self, align_entries: bool = False) -> bytes:
-        self._raw_bytes.seek(0)
-        raw_rgb_bytes = bytearray()
-        for index in range(self._total_palette_entries):
-            # READ THIS COLOR TUPLE.
-            rgb_color_tuple = self._raw_bytes.read(3)
-            if self._has_entry_alignment:
-                self._raw_bytes.read(1)
-
-            # ENSURE THE COLOR INDEX IS IN RGB ORDER.
-            colors_in_rgb_order = not self._blue_green_red_order
-            if not colors_in_rgb_order:
-                # PUT THE COLOR INDEX IN RGB ORDER.
-                # The colors are in RGB order, so the blue and the red must be swapped.
-                # 
-                # The slice notation below is used due to the following behavior:
-                #  - bytes[0] -> int (must be re-encoded to bytes, which is wasteful),
-                #  - bytes[0:1] -> bytes[0], but still as bytes.
-                blue_color_index = rgb_color_tuple[0:1]
-                green_color_index = rgb_color_tuple[1:2]
-                red_color_index = rgb_color_tuple[2:3]
-                rgb_color_tuple = red_color_index + green_color_index + blue_color_index
+        # PUT THE COLORS IN RGB ORDER.
+        # When the colors are in BGR order, the blue and the red must be swapped.
+        red_green_blue_indices = (2, 1, 0) if self._blue_green_red_order else (0, 1, 2)
+        return self.__reorder_entries(red_green_blue_indices, align_entries)
 
-            # ENSURE THE RIGHT PADDING IS ADDED.
-            unnecessary_padding_present = (self._has_entry_alignment) and (not align_entries)
-            necessary_padding_not_present = (not self._has_entry_alignment) and (align_entries)
-            if unnecessary_padding_present:
-                # REMOVE THE PADDING BYTE.
-                rgb_color_tuple = rgb_color_tuple[0:4]
-            elif necessary_padding_not_present:
-                rgb_color_tuple += b'\x00'
+    ## Copies the color tuples from the raw palette into a new palette with the
+    ## given color order and alignment.
+    ## \param[in] color_indices - For each color in an output color tuple, the index of
+    ##             that color within a color tuple of the raw palette.
+    ## \param[in] align_entries - Align each output color tuple to the dword boundary.
+    def __reorder_entries(self, color_indices, align_entries: bool) -> bytearray:
+        # ALLOCATE THE PALETTE.
+        # The whole palette is allocated at once. Because the buffer starts zeroed,
+        # any padding bytes are already present and need not be written.
+        # The stream might have ended before all the declared entries were read, 
+        # so the palette only holds the entries that were actually read.
+        total_read_palette_entries = len(self._raw_bytes) // self._palette_entry_size_in_bytes
+        output_entry_size_in_bytes = 4 if align_entries else 3
+        reordered_bytes = bytearray(total_read_palette_entries * output_entry_size_in_bytes)
 
-            # STORE THIS COLOR TUPLE.
-            raw_rgb_bytes += rgb_color_tuple
-        return raw_rgb_bytes
\ No newline at end of file
+        # COPY EACH COLOR.
+        # Rather than copying one color tuple at a time, each color is copied for
+        # all the entries at once with strided slices. Thus, the copying happens 
+        # in just three operations no matter how many entries the palette has.
+        # Any partial entry at the end of the raw palette is ignored.
+        total_read_palette_bytes = total_read_palette_entries * self._palette_entry_size_in_bytes
+        for output_index, raw_index in enumerate(color_indices):
+            reordered_bytes[output_index::output_entry_size_in_bytes] = \
+                self._raw_bytes[raw_index:total_read_palette_bytes:self._palette_entry_size_in_bytes]
+        return reordered_bytes
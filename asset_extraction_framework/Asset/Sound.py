@@ -1,12 +1,31 @@
 
-import subprocess
+import shutil
 import os
 from typing import List, Optional
 import wave
-import numpy
 
 from .Asset import Asset
 
+# The size of the write buffer used when exporting WAV files.
+WAVE_FILE_BUFFER_SIZE_IN_BYTES = 1 << 20
+# The requested size of the pipe that carries audio to ffmpeg.
+FFMPEG_PIPE_SIZE_IN_BYTES = 1 << 20
+
+# The absolute path to the ffmpeg executable, once it has been found.
+_ffmpeg_executable_path: Optional[str] = None
+
+## Finds the ffmpeg executable on the search path. Because the search path 
+## is not expected to change while assets are exported, ffmpeg is only searched
+## for until it is found. If it is not found, it is searched for again next time,
+## so ffmpeg can still be found if it is installed later.
+## \return The absolute path to ffmpeg if it can be found. Otherwise, just the
+##         name of the executable, so the error from running it is unchanged.
+def _find_ffmpeg_executable() -> str:
+    global _ffmpeg_executable_path
+    if _ffmpeg_executable_path is None:
+        _ffmpeg_executable_path = shutil.which('ffmpeg')
+    return _ffmpeg_executable_path or 'ffmpeg'
+
 ## A section of contiguous audio data.
 class Sound(Asset):
     def __init__(self):
@@ -48,6 +67,30 @@ class Sound(Asset):
     def pcm(self):
         return self._pcm
 
+    ## \return The ffmpeg command-line options that describe the raw audio piped
+    ## to ffmpeg, ending with the pipe input itself.
+    @property
+    def _ffmpeg_input_options(self) -> tuple:
+        # VERIFY THE AUDIO FORMAT IS FULLY DEFINED.
+        # Otherwise, ffmpeg would be started only to fail on its bad arguments.
+        audio_format_incomplete: bool = (self._ffmpeg_audio_type is None) or \
+            (self._sample_rate is None) or \
+            (self._channel_count is None)
+        if audio_format_incomplete:
+            raise ValueError('The ffmpeg audio type, sample rate, and channel count must all be provided '
+                             'to convert a sound with ffmpeg.')
+
+        # BUILD THE OPTIONS.
+        return (
+            # Because we are piping raw audio, we must provide a format.
+            '-f', self._ffmpeg_audio_type,
+            # The sample rate and channel count are stored as integers, 
+            # but we must convert them to strings.
+            '-ar', str(self._sample_rate),
+            '-ac', str(self._channel_count),
+            # The input file is a pipe.
+            '-i', 'pipe:')
+
     ## Exports the audio in the provided format to the provided filename.
     ## The audio can be exported in any format supported by ffmpeg.
     ## This method also has two meta-formats:
@@ -60,29 +103,53 @@ class Sound(Asset):
     ## \param[in] command_line_arguments - All the command-line arguments provided to the 
     ##            script that invoked this function.
     def export(self, root_directory_path: str, command_line_arguments):
-        filepath_without_extension = os.path.join(root_directory_path, self.name)
-        filepath_with_extension = f'{filepath_without_extension}.{command_line_arguments.audio_format}'
         if command_line_arguments.audio_format == 'none':
             # DO NOTHING.
             return
         elif command_line_arguments.audio_format == 'raw':
-            # WRITE THE RAW BYTES FROM THE FILE.
-            if self._raw is not None:
-                with open(filepath_with_extension, 'wb') as raw_file:
-                    raw_file.write(self._raw)
+            # GET THE RAW BYTES FROM THE FILE.
             # If the sound is not compressed, self.raw will have no data.
             # In this case, we want to write self.pcm directly instead.
-            elif self.pcm is not None:
-                with open(filepath_with_extension, 'wb') as pcm_file:
-                    pcm_file.write(self.pcm)
+            raw_bytes = self._raw if self._raw is not None else self.pcm
+            if raw_bytes is None:
+                # There is nothing to write, so the filepath need not even be built.
+                return
+
+            # WRITE THE RAW BYTES.
+            self._write_bytes(self.__export_filepath(root_directory_path, command_line_arguments), raw_bytes)
         else:
             # WRITE A LISTENABLE FILE.
             if self.pcm is not None:
+                filepath_with_extension = self.__export_filepath(root_directory_path, command_line_arguments)
                 if self._ffmpeg_audio_type:
                     self.convert_via_ffmpeg([self], filepath_with_extension)
                 else:
                     self.convert_via_wave([self], filepath_with_extension)
 
+    ## \return The filepath this sound should be exported to, including the 
+    ## extension for the requested audio format.
+    def __export_filepath(self, root_directory_path: str, command_line_arguments) -> str:
+        filepath_without_extension = os.path.join(root_directory_path, self.name)
+        return f'{filepath_without_extension}.{command_line_arguments.audio_format}'
+
+    ## Exports many sounds at once, each to its own file, as if export were called on each.
+    ## Each ffmpeg conversion runs in its own process, so those can run in parallel.
+    ## Sounds can decompress their PCM when exported, so only use this method if 
+    ## the sounds' PCM can be safely decompressed at the same time and in any order.
+    ## \param[in] cls -
+    ## \param[in] sounds - The sounds to export. Each must have a unique name.
+    ## \param[in] root_directory_path - The directory where the sounds should be exported.
+    ## \param[in] command_line_arguments - All the command-line arguments provided to the
+    ##            script that invoked this function.
+    ## \param[in] max_workers - The most sounds to export at once. This also bounds the 
+    ##            number of ffmpeg processes running at once. Defaults to the number of CPUs.
+    ##            When this is one or less, the sounds are exported in order on the calling thread.
+    @classmethod
+    def export_many(cls, sounds: List['Sound'], root_directory_path: str, command_line_arguments, max_workers: Optional[int] = None):
+        sound_exports = ((sound, root_directory_path) for sound in sounds)
+        worker_count = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        cls._export_all(sound_exports, command_line_arguments, worker_count)
+
     ## Writes an uncompressed WAV file using Python's built-in wave library.
     ## This is much faster than calling into ffmpeg, but only raw PCM can 
     ## be written with this method.
@@ -97,16 +164,48 @@ class Sound(Asset):
         if len(sounds) == 0:
             return
 
-        # SET UP THE WAVE FILE.
-        wave_file = wave.open(filepath, 'wb')
-        wave_file.setnchannels(sounds[0]._channel_count)
-        wave_file.setsampwidth(sounds[0]._sample_width)
-        wave_file.setframerate(sounds[0]._sample_rate)
+        # VERIFY THE AUDIO FORMAT IS FULLY DEFINED.
+        # This is checked before the export file is created, so an incomplete format
+        # neither leaves an empty file behind nor surfaces as a confusing error 
+        # from the wave library when the wave file is closed.
+        first_sound = sounds[0]
+        audio_format_incomplete: bool = (first_sound._channel_count is None) or \
+            (first_sound._sample_width is None) or \
+            (first_sound._sample_rate is None)
+        if audio_format_incomplete:
+            raise ValueError('The channel count, sample width, and sample rate must all be provided '
+                             'to write a sound to a WAV file.')
 
-        # WRITE THE AUDIO FRAMES.
-        for sound in sounds:
-            if (sound is not None) and (sound.pcm is not None):
-                wave_file.writeframes(sound.pcm)
+        # GET THE AUDIO FRAMES TO WRITE.
+        pcm_chunks = [sound.pcm for sound in sounds if (sound is not None) and (sound.pcm is not None)]
+
+        # OPEN THE EXPORT FILE.
+        # The wave library issues many small writes (header fields, then each chunk
+        # of frames), so a large buffer coalesces these into a few big writes.
+        with open(filepath, 'wb', buffering = WAVE_FILE_BUFFER_SIZE_IN_BYTES) as export_file:
+            # SET UP THE WAVE FILE.
+            # The format is set before the wave file's context is entered. Otherwise, if 
+            # the wave library rejected part of the format, closing the wave file would 
+            # raise its own error that would hide the original one.
+            wave_file = wave.open(export_file, 'wb')
+            wave_file.setnchannels(first_sound._channel_count)
+            wave_file.setsampwidth(first_sound._sample_width)
+            wave_file.setframerate(first_sound._sample_rate)
+            # Because the total length of the audio is already known, the header
+            # can be written with the correct sizes up front. Then the wave
+            # library does not need to seek back and patch the header at all.
+            bytes_per_frame = first_sound._sample_width * first_sound._channel_count
+            total_pcm_length_in_bytes = sum(len(pcm) for pcm in pcm_chunks)
+            wave_file.setnframes(total_pcm_length_in_bytes // bytes_per_frame)
+
+            with wave_file:
+                # WRITE THE AUDIO FRAMES.
+                # Unlike writeframes, writeframesraw does not check whether the header
+                # needs to be patched after every chunk. If the declared length somehow
+                # ends up being wrong, the header is instead patched once when the
+                # wave file is closed.
+                for pcm in pcm_chunks:
+                    wave_file.writeframesraw(pcm)
 
     ## Writes an audio file by calling into ffmpeg.
     ## This is significantly slower than writing a WAV file with the built-in wave library,
@@ -125,19 +224,32 @@ class Sound(Asset):
         # ASK FFMPEG TO WRITE LISTENABLE FILE.
         # The audio can be exported in any format supported by ffmpeg.
         # The raw audio is piped to ffmpeg.
-        audio_conversion_command = ['ffmpeg', \
+        # Importing subprocess is comparatively slow, and many exports never need ffmpeg,
+        # so subprocess is only imported once it is actually needed.
+        import subprocess
+        audio_conversion_command = [_find_ffmpeg_executable(), \
             # Any existing file should be overwritten without prompting.
             '-y', \
-            # Because we are piping raw audio, we must provide a format.
-            '-f', sounds[0].audio_type, \
-            '-ar', sounds[0]._sample_rate, \
-            # The channel count is stored as an integer, but we must convert to a string.
-            '-ac', str(sounds[0]._channel_count), \
-            # The input file is a pipe.
-            '-i', 'pipe:', \
+            *sounds[0]._ffmpeg_input_options, \
             # The output is the given file.
             filepath]
-        with subprocess.Popen(audio_conversion_command, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT) as ffmpeg:
+        # Giving the absolute path to ffmpeg and leaving file descriptors open lets
+        # subprocess start ffmpeg with posix_spawn rather than forking this process.
+        # File descriptors that Python itself opens are non-inheritable, so ffmpeg 
+        # will not receive those. However, ffmpeg will inherit any file descriptors
+        # that are marked inheritable, like ones this process itself inherited.
+        with subprocess.Popen(audio_conversion_command, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT, close_fds=False) as ffmpeg:
+            # ENLARGE THE PIPE TO FFMPEG.
+            # Linux pipes hold only 64 KB by default, so writing large audio would
+            # otherwise switch back and forth between this process and ffmpeg many times.
+            # This is only possible on Linux, so the pipe is left alone where it isn't
+            # supported or where the requested size exceeds the system's limit.
+            try:
+                import fcntl
+                fcntl.fcntl(ffmpeg.stdin.fileno(), fcntl.F_SETPIPE_SZ, FFMPEG_PIPE_SIZE_IN_BYTES)
+            except (ImportError, AttributeError, OSError):
+                pass
+
             for sound in sounds:
                 if sound.pcm is not None:
                     ffmpeg.stdin.write(sound.pcm)